@@ -4,11 +4,24 @@ Simple API server to serve market anomalies and statistics
 for the web dashboard.
 """
 
-from http.server import HTTPServer, BaseHTTPRequestHandler
-import json
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from concurrent.futures import ThreadPoolExecutor
+import gzip
 import time
 import threading
 import random
+import socket
+
+try:
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
 
 # Mock data for market anomalies
 mock_opportunities = [
@@ -46,64 +59,207 @@ mock_stats = {
     "last_update": time.time()
 }
 
+# Status line and headers for JSON responses, filled with
+# (content length, connection, extra header lines)
+HEADERS_JSON = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Cache-Control: max-age=0\r\n"
+    b"Content-Length: %d\r\n"
+    b"Connection: %s\r\n"
+    b"%s"
+    b"\r\n"
+)
+VARY_HEADERS = b"Vary: Accept-Encoding\r\n"
+GZIP_HEADERS = b"Content-Encoding: gzip\r\n" + VARY_HEADERS
+
+# Possible detected_at ages, in seconds
+_OFFSETS = range(11)
+
+def _opportunities_template():
+    """Serialize mock_opportunities once, leaving %-placeholders for detected_at."""
+    placeholders = [{**opp, "detected_at": "__TS%d__" % i}
+                    for i, opp in enumerate(mock_opportunities)]
+    template = dumps(placeholders).replace(b"%", b"%%")
+    for i in range(len(mock_opportunities)):
+        template = template.replace(b'"__TS%d__"' % i, b"%.3f")
+    return template
+
+_OPPORTUNITIES_TEMPLATE = _opportunities_template()
+
+def build_opportunities(now):
+    """Return the opportunities payload as (plain, gzip-compressed) bytes."""
+    # Update mock data with current timestamps
+    offsets = random.choices(_OFFSETS, k=len(mock_opportunities))
+    body = _OPPORTUNITIES_TEMPLATE % tuple(now - offset for offset in offsets)
+    # Fastest level: compressed once per refresh, served to every request
+    return body, gzip.compress(body, compresslevel=1)
+
+def build_stats(now):
+    # Update mock stats (only called from the refresher thread)
+    mock_stats["last_update"] = now
+    mock_stats["messages_processed"] += random.randint(10, 100)
+    mock_stats["anomalies_found"] += random.randint(0, 3)
+    return dumps(mock_stats)
+
+# Latest serialized payloads, replaced wholesale by the refresher thread
+_OPPS_PAYLOADS = build_opportunities(time.time())
+_STATS_BYTES = build_stats(time.time())
+REFRESH_INTERVAL = 0.2
+
+def refresher():
+    global _OPPS_PAYLOADS, _STATS_BYTES
+    _time, _monotonic, _sleep = time.time, time.monotonic, time.sleep
+    # Schedule on the monotonic clock so wall-clock jumps and build time
+    # do not skew the refresh rate; wall time is only used for payloads
+    deadline = _monotonic()
+    while True:
+        deadline = max(deadline + REFRESH_INTERVAL, _monotonic())
+        _sleep(max(0.0, deadline - _monotonic()))
+        now = _time()
+        _OPPS_PAYLOADS = build_opportunities(now)
+        _STATS_BYTES = build_stats(now)
+
+HEALTH_TMPL = b'{"status":"healthy","timestamp":%.3f}'
+
+# Current payloads, shared with the aiohttp server in app.py
+def opportunities_payloads():
+    """Return the latest opportunities payload as (plain, gzip) bytes."""
+    return _OPPS_PAYLOADS
+
+def stats_payload():
+    return _STATS_BYTES
+
+def health_payload():
+    return HEALTH_TMPL % time.time()
+
+def sendmsg_all(sock, buffers):
+    """Send buffers with scatter/gather sendmsg, retrying partial sends."""
+    views = [memoryview(buf) for buf in buffers]
+    while views:
+        sent = sock.sendmsg(views)
+        while views and sent >= len(views[0]):
+            sent -= len(views.pop(0))
+        if sent:
+            views[0] = views[0][sent:]
+
 class APIServer(BaseHTTPRequestHandler):
+    # Keep-alive lets dashboard polls reuse one connection; the timeout
+    # frees the worker from connections that go idle
+    protocol_version = "HTTP/1.1"
+    timeout = 5
+
     def do_GET(self):
         if self.path == '/api/opportunities':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            # Update mock data with current timestamps
-            updated_opportunities = []
-            for opp in mock_opportunities:
-                updated_opp = opp.copy()
-                updated_opp["detected_at"] = time.time() - random.randint(0, 10)
-                updated_opportunities.append(updated_opp)
-            
-            self.wfile.write(json.dumps(updated_opportunities).encode())
+            body, gzip_body = opportunities_payloads()
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                self.send_json(gzip_body, GZIP_HEADERS)
+            else:
+                self.send_json(body, VARY_HEADERS)
             
         elif self.path == '/api/stats':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            # Update mock stats
-            updated_stats = mock_stats.copy()
-            updated_stats["last_update"] = time.time()
-            updated_stats["messages_processed"] += random.randint(10, 100)
-            updated_stats["anomalies_found"] += random.randint(0, 3)
-            
-            response = json.dumps(updated_stats)
-            self.wfile.write(response.encode())
+            self.send_json(stats_payload())
             
         elif self.path == '/health':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            health_data = {
-                "status": "healthy",
-                "timestamp": time.time()
-            }
-            self.wfile.write(json.dumps(health_data).encode())
+            self.send_json(health_payload())
             
         else:
+            body = b'Not Found'
             self.send_response(404)
+            self.send_header('Content-Length', str(len(body)))
             self.end_headers()
-            self.wfile.write(b'Not Found')
+            self.wfile.write(body)
+            self.wfile.flush()
+
+    def log_error(self, format, *args):
+        # An idle keep-alive connection timing out is routine, not an error
+        if format.startswith("Request timed out"):
+            return
+        super().log_error(format, *args)
+
+    def send_json(self, payload, extra_headers=b""):
+        # Headers and body go out in a single write
+        self.log_request(200)
+        connection = b"close" if self.close_connection else b"keep-alive"
+        headers = HEADERS_JSON % (len(payload), connection, extra_headers)
+        if hasattr(self.connection, 'sendmsg'):
+            # Gather-write straight from the cached bytes, no concatenation
+            sendmsg_all(self.connection, [headers, payload])
+        else:
+            self.wfile.write(headers + payload)
+
+# Each keep-alive connection occupies a worker until it closes or idles
+# out, so the pool is sized for concurrent connections rather than CPUs
+MAX_CONNECTIONS = 64
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that handles requests on a fixed worker pool.
+
+    At most max_workers connections are handed to the pool at once; further
+    connections wait in the listen backlog (request_queue_size) until a
+    worker frees up.
+    """
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(self, server_address, handler_class, max_workers=None):
+        super().__init__(server_address, handler_class)
+        max_workers = max_workers or MAX_CONNECTIONS
+        self.pool = ThreadPoolExecutor(max_workers=max_workers)
+        self.slots = threading.BoundedSemaphore(max_workers)
+        self.active = set()
+        self.active_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        self.slots.acquire()
+        with self.active_lock:
+            self.active.add(request)
+        try:
+            self.pool.submit(self.process_request_worker, request, client_address)
+        except RuntimeError:
+            # Pool already shut down
+            self.process_request_done(request)
+            self.shutdown_request(request)
+
+    def process_request_worker(self, request, client_address):
+        try:
+            self.process_request_thread(request, client_address)
+        finally:
+            self.process_request_done(request)
+
+    def process_request_done(self, request):
+        with self.active_lock:
+            self.active.discard(request)
+        self.slots.release()
+
+    def server_close(self):
+        super().server_close()
+        # Unblock workers waiting on open connections so the pool can exit
+        with self.active_lock:
+            active = list(self.active)
+        for request in active:
+            try:
+                request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self.pool.shutdown(wait=True)
 
 def run_server():
     server_address = ('localhost', 8001)
-    httpd = HTTPServer(server_address, APIServer)
+    httpd = PooledHTTPServer(server_address, APIServer)
+    threading.Thread(target=refresher, daemon=True).start()
     print("🚀 API Server running on port 8001")
     print("Available endpoints:")
     print("  GET /api/opportunities - Get recent market anomalies")
     print("  GET /api/stats - Get performance statistics")
     print("  GET /health - Health check")
-    httpd.serve_forever()
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
 
 if __name__ == '__main__':
     run_server()
\ No newline at end of file
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Asyncio API server for the web dashboard, built on aiohttp.
+Serves the same endpoints and payloads as api_server.py from a
+single event loop.
+"""
+
+import threading
+
+from aiohttp import web
+
+import api_server
+
+JSON_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Cache-Control': 'max-age=0',
+}
+
+def json_response(body, headers=None):
+    return web.Response(body=body, content_type='application/json',
+                        headers=headers or JSON_HEADERS)
+
+async def opportunities(request):
+    body, gzip_body = api_server.opportunities_payloads()
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        return json_response(gzip_body, {**JSON_HEADERS,
+                                         'Content-Encoding': 'gzip',
+                                         'Vary': 'Accept-Encoding'})
+    return json_response(body, {**JSON_HEADERS, 'Vary': 'Accept-Encoding'})
+
+async def stats(request):
+    return json_response(api_server.stats_payload())
+
+async def health(request):
+    return json_response(api_server.health_payload())
+
+async def start_refresher(app):
+    threading.Thread(target=api_server.refresher, daemon=True).start()
+
+def create_app():
+    app = web.Application()
+    app.router.add_get('/api/opportunities', opportunities)
+    app.router.add_get('/api/stats', stats)
+    app.router.add_get('/health', health)
+    app.on_startup.append(start_refresher)
+    return app
+
+def run_server():
+    print("🚀 API Server (aiohttp) running on port 8001")
+    print("Available endpoints:")
+    print("  GET /api/opportunities - Get recent market anomalies")
+    print("  GET /api/stats - Get performance statistics")
+    print("  GET /health - Health check")
+    web.run_app(create_app(), host='localhost', port=8001, print=None)
+
+if __name__ == '__main__':
+    run_server()
@@ -1,3 +1,4 @@
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 
@@ -36,32 +37,37 @@ colors = {
     'storage': '#D2BA4C'       # Moderate yellow
 }
 
-# Add component boxes
+# Add component boxes and labels in one batch
+shapes = []
+xs, ys, texts, hovers = [], [], [], []
 for name, info in components.items():
     color = colors[info['type']]
     
-    # Create hover text with details
-    hover_text = f"<b>{name}</b><br>" + "<br>".join(info['details'])
-    
-    # Add rectangle for component
-    fig.add_shape(
+    # Rectangle for component
+    shapes.append(dict(
         type="rect",
         x0=info['x']-0.35, y0=info['y']-0.15,
         x1=info['x']+0.35, y1=info['y']+0.15,
         fillcolor=color,
         line=dict(color="black", width=2),
         opacity=0.8
-    )
-    
-    # Add text label
-    fig.add_trace(go.Scatter(
-        x=[info['x']], y=[info['y']],
-        text=[name],
-        mode='text',
-        textfont=dict(size=11, color='white', family='Arial Black'),
-        hovertemplate=hover_text + "<extra></extra>",
-        showlegend=False
     ))
+    
+    # Text label with details on hover
+    xs.append(info['x'])
+    ys.append(info['y'])
+    texts.append(name)
+    hovers.append(f"<b>{name}</b><br>" + "<br>".join(info['details']))
+
+fig.add_trace(go.Scatter(
+    x=xs, y=ys,
+    text=texts,
+    mode='text',
+    textfont=dict(size=11, color='white', family='Arial Black'),
+    hovertext=hovers,
+    hovertemplate='%{hovertext}<extra></extra>',
+    showlegend=False
+))
 
 # Add connection arrows
 connections = [
@@ -76,22 +82,24 @@ connections = [
     ('Arbitrage Engine', 'Storage')
 ]
 
-for start, end in connections:
-    start_pos = components[start]
-    end_pos = components[end]
-    
-    # Calculate arrow positions
-    if start_pos['y'] > end_pos['y']:  # Downward arrow
-        start_y = start_pos['y'] - 0.15
-        end_y = end_pos['y'] + 0.15
-    else:  # Upward or sideways arrow
-        start_y = start_pos['y']
-        end_y = end_pos['y']
-    
-    # Add arrow
-    fig.add_annotation(
-        x=end_pos['x'], y=end_y,
-        ax=start_pos['x'], ay=start_y,
+# Component coordinates as parallel arrays, indexed by name
+names = list(components)
+idx = {name: i for i, name in enumerate(names)}
+comp_x = np.array([components[n]['x'] for n in names])
+comp_y = np.array([components[n]['y'] for n in names])
+
+# Calculate arrow positions: downward arrows run between box edges,
+# upward or sideways arrows between box centres
+si = np.array([idx[start] for start, _ in connections])
+ei = np.array([idx[end] for _, end in connections])
+downward = comp_y[si] > comp_y[ei]
+start_ys = np.where(downward, comp_y[si] - 0.15, comp_y[si])
+end_ys = np.where(downward, comp_y[ei] + 0.15, comp_y[ei])
+
+arrows = [
+    dict(
+        x=x, y=y,
+        ax=ax, ay=ay,
         xref='x', yref='y',
         axref='x', ayref='y',
         showarrow=True,
@@ -100,6 +108,9 @@ for start, end in connections:
         arrowwidth=2,
         arrowcolor='#333333'
     )
+    for x, y, ax, ay in zip(comp_x[ei].tolist(), end_ys.tolist(),
+                            comp_x[si].tolist(), start_ys.tolist())
+]
 
 # Create legend
 legend_items = [
@@ -121,6 +132,8 @@ for i, (label, color) in enumerate(legend_items):
 
 # Update layout
 fig.update_layout(
+    shapes=shapes,
+    annotations=arrows,
     title="Crypto Arbitrage Scanner Architecture",
     xaxis=dict(range=[-0.5, 4], showgrid=False, showticklabels=False, zeroline=False),
     yaxis=dict(range=[0, 5.5], showgrid=False, showticklabels=False, zeroline=False),
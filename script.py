@@ -65,18 +65,28 @@ project_structure = {
     }
 }
 
+def flatten_structure(base_path, structure):
+    dirs, files = {base_path} if base_path else set(), []
+    stack = [(base_path, structure)]
+    while stack:
+        parent, children = stack.pop()
+        for name, content in children.items():
+            path = os.path.join(parent, name)
+            if isinstance(content, dict):
+                dirs.add(path)
+                stack.append((path, content))
+            else:
+                files.append(path)
+    return dirs, files
+
 # Create directory structure and placeholder files
 def create_structure(base_path, structure):
-    for name, content in structure.items():
-        path = os.path.join(base_path, name)
-        if isinstance(content, dict):
-            os.makedirs(path, exist_ok=True)
-            create_structure(path, content)
-        else:
-            # Create file
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, 'w') as f:
-                f.write("")
+    dirs, files = flatten_structure(base_path, structure)
+    for d in sorted(dirs):
+        os.makedirs(d, exist_ok=True)
+    # Parents all exist now; create empty files without the io wrapper
+    for path in files:
+        os.close(os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644))
 
 print("Project structure created successfully!")
 print("\nProject Overview:")